@@ -38,35 +38,88 @@ from ._utils import (
     has_default_constructor,
     has_one_param_constructor,
 )
-from .port import Port
-from .ports import Ports
-from .logging_port import LoggingPort
-from .logging_port_fallback import LoggingPortFallback
-from .base_object import BaseObject
-from .invariant import inject_all_invariants, inject_invariants, Invariant
-from .invariants import Invariants
-from .pythoneda_application import PythonedaApplication
-from .formatting import Formatting
-from .sensitive_value import SensitiveValue
-from .value_object import (
-    attribute,
-    filter_attribute,
-    internal_attribute,
-    primary_key_attribute,
-    sensitive,
-    ValueObject,
-)
-from .domain_exception import DomainException
-from .unsupported_event import UnsupportedEvent
-from .entity import Entity
-from .entity_in_progress import EntityInProgress
-from .event import Event
-from .event_emitter import EventEmitter
-from .event_listener import listen, EventListener
-from .primary_port import PrimaryPort
-from .event_listener_port import EventListenerPort
-from .repo import Repo
-from .flow import Flow
+import importlib
+
+# Public name -> submodule defining it. Those are imported on first access
+# (PEP 562), so using a few names doesn't load the whole package.
+_lazy_attributes = {
+    "Port": ".port",
+    "Ports": ".ports",
+    "LoggingPort": ".logging_port",
+    "LoggingPortFallback": ".logging_port_fallback",
+    "BaseObject": ".base_object",
+    "inject_all_invariants": ".invariant",
+    "inject_invariants": ".invariant",
+    "Invariant": ".invariant",
+    "Invariants": ".invariants",
+    "PythonedaApplication": ".pythoneda_application",
+    "Formatting": ".formatting",
+    "SensitiveValue": ".sensitive_value",
+    "attribute": ".value_object",
+    "filter_attribute": ".value_object",
+    "internal_attribute": ".value_object",
+    "primary_key_attribute": ".value_object",
+    "sensitive": ".value_object",
+    "ValueObject": ".value_object",
+    "DomainException": ".domain_exception",
+    "UnsupportedEvent": ".unsupported_event",
+    "Entity": ".entity",
+    "EntityInProgress": ".entity_in_progress",
+    "Event": ".event",
+    "EventEmitter": ".event_emitter",
+    "listen": ".event_listener",
+    "EventListener": ".event_listener",
+    "PrimaryPort": ".primary_port",
+    "EventListenerPort": ".event_listener_port",
+    "Repo": ".repo",
+    "Flow": ".flow",
+}
+
+__all__ = [
+    "full_class_name",
+    "snake_to_camel",
+    "camel_to_snake",
+    "kebab_to_camel",
+    "camel_to_kebab",
+    "kebab_to_snake",
+    "snake_to_kebab",
+    "simplify_class_name",
+    "has_method",
+    "has_class_method",
+    "sort_by_priority",
+    "method_has_no_parameters",
+    "method_has_one_parameter",
+    "has_default_constructor",
+    "has_one_param_constructor",
+    *_lazy_attributes,
+]
+
+
+def __getattr__(name: str):
+    """
+    Imports the submodule defining given public name, on first access.
+    :param name: The name.
+    :type name: str
+    :return: The value bound to that name.
+    :rtype: Any
+    """
+    module_name = _lazy_attributes.get(name, None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    result = getattr(importlib.import_module(module_name, __name__), name)
+    # Bind it, so later accesses don't go through __getattr__ again
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    """
+    Lists the public names, including those not imported yet.
+    :return: Such names.
+    :rtype: List[str]
+    """
+    return sorted(set(globals()) | set(__all__))
+
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
 # Local Variables:
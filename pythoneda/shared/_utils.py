@@ -19,9 +19,54 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import functools
 import inspect
-import re
-from typing import Type
+import string
+import sys
+from typing import Callable, Type
+
+_LOWER_OR_DIGIT = frozenset(string.ascii_lowercase + string.digits)
+_UPPER = frozenset(string.ascii_uppercase)
+
+
+class _Memo(dict):
+    """
+    Dictionary that computes, and remembers, the values of missing keys.
+
+    Class name: _Memo
+
+    Responsibilities:
+        - Cache the results of pure, single-argument functions.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, compute: Callable):
+        """
+        Creates a new _Memo instance.
+        :param compute: The function computing the value of a key.
+        :type compute: Callable
+        """
+        super().__init__()
+        self._compute = compute
+
+    def __missing__(self, key):
+        """
+        Computes and stores the value of given key.
+        :param key: The key.
+        :type key: Any
+        :return: Its value.
+        :rtype: Any
+        """
+        result = self._compute(key)
+        self[key] = result
+        return result
+
+
+# Class -> its full name. As every per-class cache in this package, it
+# references the classes strongly.
+_full_class_names = {}
 
 
 def full_class_name(target: Type = None) -> str:
@@ -32,10 +77,27 @@ def full_class_name(target: Type = None) -> str:
     :return: The key.
     :rtype: str
     """
-    actual_target = target
-    if actual_target is None:
-        actual_target = cls
-    return f"{actual_target.__module__}.{actual_target.__name__}"
+    result = _full_class_names.get(target, None)
+    if result is None:
+        # Interned, so registry lookups by class key compare by identity
+        result = sys.intern(f"{target.__module__}.{target.__name__}")
+        _full_class_names[target] = result
+    return result
+
+
+def _snake_to_camel(inputText: str) -> str:
+    """
+    Converts a string in snake case to camel case.
+    :param inputText: The snake-case input to convert.
+    :type inputText: str
+    :return: The camel-case version of the input.
+    :rtype: str
+    """
+    # "_" is not a cased character, so title() capitalizes each component
+    return inputText.title().replace("_", "")
+
+
+_snake_to_camel_cache = _Memo(_snake_to_camel)
 
 
 def snake_to_camel(inputText: str) -> str:
@@ -46,11 +108,34 @@ def snake_to_camel(inputText: str) -> str:
     :return: The camel-case version of the input.
     :rtype: str
     """
-    components = inputText.split("_")
-    return "".join(x.title() for x in components)
+    return _snake_to_camel_cache[inputText]
 
 
-def camel_to_snake(cls, inputText: str) -> str:
+def _split_camel(txt: str, separator: str) -> str:
+    """
+    Inserts given separator wherever a lower-case letter or digit is followed
+    by an upper-case letter, and lower-cases the result.
+    :param txt: The camel-case value.
+    :type txt: str
+    :param separator: The separator.
+    :type separator: str
+    :return: The separated, lower-case value.
+    :rtype: str
+    """
+    if txt.islower():
+        # Nothing to separate, nor to lower-case
+        return txt
+    result = []
+    previous = ""
+    for char in txt:
+        if char in _UPPER and previous in _LOWER_OR_DIGIT:
+            result.append(separator)
+        result.append(char)
+        previous = char
+    return "".join(result).lower()
+
+
+def _camel_to_snake(inputText: str) -> str:
     """
     Converts a string in camel case, to snake case.
     :param inputText: The camel-case input to convert.
@@ -58,10 +143,24 @@ def camel_to_snake(cls, inputText: str) -> str:
     :return: The snake-case version of the input.
     :rtype: str
     """
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", inputText).lower()
+    return _split_camel(inputText, "_")
 
 
-def kebab_to_camel(txt: str) -> str:
+_camel_to_snake_cache = _Memo(_camel_to_snake)
+
+
+def camel_to_snake(inputText: str) -> str:
+    """
+    Converts a string in camel case, to snake case.
+    :param inputText: The camel-case input to convert.
+    :type inputText: str
+    :return: The snake-case version of the input.
+    :rtype: str
+    """
+    return _camel_to_snake_cache[inputText]
+
+
+def _kebab_to_camel(txt: str) -> str:
     """
     Transforms given kebab-case value to camel case.
     :param txt: The value.
@@ -69,11 +168,42 @@ def kebab_to_camel(txt: str) -> str:
     :return: The value formatted in camel case.
     :rtype: str
     """
-    words = txt.split("-")
-    result = "".join(word.capitalize() for word in words)
+    if "-" in txt:
+        result = "".join([word.capitalize() for word in txt.split("-")])
+    else:
+        # A single word: no need to split and join
+        result = txt.capitalize()
     return result[0].lower() + result[1:]
 
 
+_kebab_to_camel_cache = _Memo(_kebab_to_camel)
+
+
+def kebab_to_camel(txt: str) -> str:
+    """
+    Transforms given kebab-case value to camel case.
+    :param txt: The value.
+    :type txt: str
+    :return: The value formatted in camel case.
+    :rtype: str
+    """
+    return _kebab_to_camel_cache[txt]
+
+
+def _camel_to_kebab(txt: str) -> str:
+    """
+    Transforms given camel-case value to kebab case.
+    :param txt: The value.
+    :type txt: str
+    :return: The value formatted in kebab case.
+    :rtype: str
+    """
+    return _split_camel(txt, "-")
+
+
+_camel_to_kebab_cache = _Memo(_camel_to_kebab)
+
+
 def camel_to_kebab(txt: str) -> str:
     """
     Transforms given camel-case value to kebab case.
@@ -82,13 +212,10 @@ def camel_to_kebab(txt: str) -> str:
     :return: The value formatted in kebab case.
     :rtype: str
     """
-    # Use regular expression to find capital letters and prepend them with a hyphen
-    result = re.sub("([a-z0-9])([A-Z])", r"\1-\2", txt)
-    # Convert the string to lowercase
-    return result.lower()
+    return _camel_to_kebab_cache[txt]
 
 
-def kebab_to_snake(txt: str) -> str:
+def _kebab_to_snake(txt: str) -> str:
     """
     Transforms given kebab-case value to snake case.
     :param txt: The value.
@@ -99,7 +226,21 @@ def kebab_to_snake(txt: str) -> str:
     return camel_to_snake(kebab_to_camel(txt))
 
 
-def snake_to_kebab(txt: str) -> str:
+_kebab_to_snake_cache = _Memo(_kebab_to_snake)
+
+
+def kebab_to_snake(txt: str) -> str:
+    """
+    Transforms given kebab-case value to snake case.
+    :param txt: The value.
+    :type txt: str
+    :return: The value formatted in snake case.
+    :rtype: str
+    """
+    return _kebab_to_snake_cache[txt]
+
+
+def _snake_to_kebab(txt: str) -> str:
     """
     Transforms given snake-case value to kebab case.
     :param txt: The value.
@@ -110,7 +251,21 @@ def snake_to_kebab(txt: str) -> str:
     return camel_to_kebab(snake_to_camel(txt))
 
 
-def simplify_class_name(inputText: str) -> str:
+_snake_to_kebab_cache = _Memo(_snake_to_kebab)
+
+
+def snake_to_kebab(txt: str) -> str:
+    """
+    Transforms given snake-case value to kebab case.
+    :param txt: The value.
+    :type txt: str
+    :return: The value formatted in kebab case.
+    :rtype: str
+    """
+    return _snake_to_kebab_cache[txt]
+
+
+def _simplify_class_name(inputText: str) -> str:
     """
     Simplifies given class name to remove the module if it's just a snake-case version of the actual class name.
     :param inputText: The class name to simplify.
@@ -119,25 +274,33 @@ def simplify_class_name(inputText: str) -> str:
     :rtype: str
     """
     result = inputText
-    if "." in inputText:
-        # If there's no dot, it's not a fully qualified class name
+    # If there's no dot, it's not a fully qualified class name
+    class_dot = inputText.rfind(".")
+    if class_dot >= 0:
+        # The last part of the module path starts after the previous dot, if any
+        module_start = inputText.rfind(".", 0, class_dot) + 1
+        class_name = inputText[class_dot + 1 :]
 
-        module_name, class_name = inputText.rsplit(".", 1)
+        # Check if the class name is the CamelCase version of the last part of the module name
+        if class_name == snake_to_camel(inputText[module_start:class_dot]):
+            # Remove the last part of the module name and keep the class name
+            result = inputText[:module_start] + class_name
 
-        # Extract the last part of the module path (if it exists)
-        last_module_name = (
-            module_name.split(".")[-1] if "." in module_name else module_name
-        )
+    return result
 
-        # Convert the last part of the module path to CamelCase
-        camel_case_last_module = snake_to_camel(last_module_name)
 
-        # Check if the class name is the CamelCase version of the last part of the module name
-        if class_name == camel_case_last_module:
-            # Remove the last part of the module name and append the class name
-            result = ".".join(module_name.split(".")[:-1] + [class_name])
+_simplify_class_name_cache = _Memo(_simplify_class_name)
 
-    return result
+
+def simplify_class_name(inputText: str) -> str:
+    """
+    Simplifies given class name to remove the module if it's just a snake-case version of the actual class name.
+    :param inputText: The class name to simplify.
+    :type inputText: str
+    :return: The simplified class name, or the input if it doesn't need to be simplified.
+    :rtype: str
+    """
+    return _simplify_class_name_cache[inputText]
 
 
 def has_method(cls, methodName: str) -> bool:
@@ -177,6 +340,26 @@ def sort_by_priority(otherClass) -> int:
     return Ports.sort_by_priority(otherClass)
 
 
+# inspect.signature is expensive, and signatures don't change: check them once.
+# Bounded, since bound methods (and so their instances) end up in the keys.
+@functools.lru_cache(maxsize=512)
+def _all_parameters_defaulted(func: Callable, firstParameter: str) -> bool:
+    """
+    Checks if all parameters of given function, except the first one, have defaults.
+    :param func: The function.
+    :type func: Callable
+    :param firstParameter: The name of its first parameter.
+    :type firstParameter: str
+    :return: True in such case.
+    :rtype: bool
+    """
+    parameters = inspect.signature(func).parameters.values()
+    return all(
+        p.default is not inspect.Parameter.empty or p.name == firstParameter
+        for p in parameters
+    )
+
+
 def method_has_no_parameters(cls, methodName: str) -> bool:
     """
     Checks if this class defines given method, and it doesn't define parameters.
@@ -186,18 +369,12 @@ def method_has_no_parameters(cls, methodName: str) -> bool:
     result = False
     if has_method(cls, methodName):
         method = getattr(cls, methodName)
-        init_signature = inspect.signature(method)
 
         first_parameter = "self"
         if isinstance(method, classmethod):
             first_parameter = "cls"
 
-        # Check if all parameters except 'self' (or 'cls' if class method) have defaults
-        parameters = init_signature.parameters.values()
-        result = all(
-            p.default is not inspect.Parameter.empty or p.name == first_parameter
-            for p in parameters
-        )
+        result = _all_parameters_defaulted(method, first_parameter)
 
     return result
 
@@ -241,15 +418,7 @@ def has_default_constructor(cls) -> bool:
     :return: True in such case.
     :rtype: bool
     """
-    init_signature = inspect.signature(cls.__init__)
-
-    # Check if all parameters except 'self' have defaults
-    parameters = init_signature.parameters.values()
-    result = all(
-        p.default is not inspect.Parameter.empty or p.name == "self" for p in parameters
-    )
-
-    return result
+    return _all_parameters_defaulted(cls.__init__, "self")
 
 
 def has_one_param_constructor(cls, paramType):
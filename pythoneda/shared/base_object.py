@@ -19,7 +19,6 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-import inspect
 from . import (
     full_class_name,
     has_class_method,
@@ -29,7 +28,6 @@ from . import (
 )
 from .logging_port import LoggingPort
 from .logging_port_fallback import LoggingPortFallback
-import re
 from typing import Dict, Type
 
 
@@ -46,7 +44,12 @@ class BaseObject:
         - None
     """
 
+    # Keeps BaseObject out of the instance layout, so slotted subclasses stay lean
+    __slots__ = ()
+
     _logging_port = None
+    _loggers = {}
+    _fallback_loggers = {}
 
     @classmethod
     def class_name(cls, target: Type = None) -> str:
@@ -57,7 +60,10 @@ class BaseObject:
         :return: The key.
         :rtype: str
         """
-        return full_class_name(target).split(".")[-1]
+        if target is None:
+            target = cls
+        # The last segment of full_class_name(target), without building it
+        return target.__name__
 
     @classmethod
     def full_class_name(cls) -> str:
@@ -77,26 +83,39 @@ class BaseObject:
         :return: Such instance.
         :rtype: Any
         """
-        temporary = False
-        port = cls._logging_port
-        if port is None:
-            temporary = True
-            from .ports import Ports
-
-            ports = Ports.instance(False)
-            if ports is not None:
-                port = ports.resolve_first(LoggingPort)
-        if port is None and temporary:
-            port = LoggingPortFallback("info")
-
-        aux = category
-        if aux is None:
-            aux = simplify_class_name(full_class_name(cls))
-
-        if not temporary:
-            cls._logging_port = port
-
-        return port.logger(aux)
+        # The default category is the common case: key it by class alone
+        key = cls if category is None else (cls, category)
+        result = BaseObject._loggers.get(key, None)
+        if result is None:
+            port = cls._logging_port
+            if port is None:
+                from .ports import Ports
+
+                ports = Ports.instance(False)
+                if ports is not None:
+                    port = ports.resolve_first(LoggingPort)
+            if port is None:
+                # Kept apart, so the actual LoggingPort gets picked up once
+                # Ports is initialized.
+                cache = BaseObject._fallback_loggers
+                result = cache.get(key, None)
+            else:
+                if cls._logging_port is None:
+                    # Resolved through Ports: share it with every class
+                    BaseObject._logging_port = port
+                cache = BaseObject._loggers
+
+            if result is None:
+                if port is None:
+                    port = LoggingPortFallback("info")
+                aux = category
+                if aux is None:
+                    aux = simplify_class_name(full_class_name(cls))
+
+                result = port.logger(aux)
+                cache[key] = result
+
+        return result
 
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
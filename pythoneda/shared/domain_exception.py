@@ -24,6 +24,9 @@ import gettext
 import os
 from pathlib import Path
 
+_base_dir = Path(__file__).resolve().parent.parent
+_translations = {}
+
 
 class DomainException(Exception, ValueObject):
     """
@@ -68,15 +71,16 @@ class DomainException(Exception, ValueObject):
         :return: The message according to the locale.
         :rtype: str
         """
-        localedir = os.path.join(
-            Path(__file__).resolve().parent.parent, self.__class__.locale_dir, "locale"
-        )
-        t = gettext.translation(
-            "pythoneda",
-            localedir=self.__class__.locale_dir,
-            languages=[locale],
-            fallback=True,
-        )
+        locale_dir = self.__class__.locale_dir
+        t = _translations.get((locale_dir, locale), None)
+        if t is None:
+            t = gettext.translation(
+                "pythoneda",
+                localedir=os.path.join(_base_dir, locale_dir, "locale"),
+                languages=[locale],
+                fallback=True,
+            )
+            _translations[(locale_dir, locale)] = t
         _ = t.gettext
 
         return _(self.message)
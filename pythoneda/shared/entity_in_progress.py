@@ -20,6 +20,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from .value_object import ValueObject
+from typing import Tuple
 
 
 class EntityInProgress(ValueObject):
@@ -53,8 +54,7 @@ class EntityInProgress(ValueObject):
         :param entityInProgress: The instance to register.
         :type entityInProgress: EntityInProgress
         """
-        if entityInProgress not in cls._pending:
-            cls._pending[cls.build_key_from_entity(entityInProgress)] = entityInProgress
+        cls._pending[cls.build_key_from_entity(entityInProgress)] = entityInProgress
 
     @classmethod
     def matching(cls, **kwargs):
@@ -68,32 +68,28 @@ class EntityInProgress(ValueObject):
         return cls._pending.get(cls.build_key_from_attributes(**kwargs), None)
 
     @classmethod
-    def build_key_from_attributes(cls, **kwargs) -> str:
+    def build_key_from_attributes(cls, **kwargs) -> Tuple:
         """
         Builds a key from the provided attributes.
         :param kwargs: The attribute information.
         :type kwargs: Dict
         :return: The key.
-        :rtype: str
+        :rtype: Tuple
         """
-        items = []
-        for key in cls.primary_key():
-            items.append(f'"{key}": "{kwargs.get(key, "")}"')
-        return f'{{ {", ".join(items)} }}'
+        return tuple(kwargs.get(key, "") for key in cls._primary_key_names)
 
     @classmethod
-    def build_key_from_entity(cls, entityInProgress) -> str:
+    def build_key_from_entity(cls, entityInProgress) -> Tuple:
         """
         Builds a key for given entity (in progress).
         :param entityInProgress: The entity in progress.
         :type entityInProgress: EntityInProgress
         :return: The key.
-        :rtype: str
+        :rtype: Tuple
         """
-        items = []
-        for key in cls.primary_key():
-            items.append(f'"{key}": "{getattr(entityInProgress, key, "")}"')
-        return f'{{ {", ".join(items)} }}'
+        return tuple(
+            getattr(entityInProgress, key, "") for key in cls._primary_key_names
+        )
 
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
@@ -20,6 +20,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from . import internal_attribute, ValueObject
+import logging
 from typing import List
 
 
@@ -62,7 +63,10 @@ class Event(ValueObject):
             self._previous_event_ids = previousEventIds
         elif reconstructedPreviousEventIds is not None:
             self._previous_event_ids = reconstructedPreviousEventIds
-        Event.logger().debug(f"Event {self} created.")
+        logger = Event.logger()
+        # Rendering the event is costly: skip it unless it gets logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Event {self} created.")
 
     @property
     @internal_attribute
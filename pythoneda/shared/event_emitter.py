@@ -21,7 +21,109 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from . import BaseObject, Event, Port
 import abc
-from typing import Dict
+import asyncio
+from typing import Callable, Dict, List
+
+
+class _EmitBatcher:
+    """
+    Collects emitted events and hands them to the receivers in batches.
+
+    Class name: _EmitBatcher
+
+    Responsibilities:
+        - Queue events until a batch is full or the delay expires.
+        - Deliver each batch to all receivers concurrently.
+
+    Collaborators:
+        - EventEmitter: Owns the batcher and performs the delivery.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable,
+        maxBatch: int,
+        maxDelay: float,
+        maxSize: int,
+    ):
+        """
+        Creates a new _EmitBatcher instance.
+        :param deliver: The coroutine function receiving each batch.
+        :type deliver: Callable
+        :param maxBatch: The maximum number of events per batch.
+        :type maxBatch: int
+        :param maxDelay: The seconds to wait for a batch to fill up.
+        :type maxDelay: float
+        :param maxSize: The queue capacity (0 means unbounded).
+        :type maxSize: int
+        """
+        self._deliver = deliver
+        self._max_batch = maxBatch
+        self._max_delay = maxDelay
+        self._max_size = maxSize
+        self._queue = None
+        self._task = None
+
+    async def put(self, event: Event):
+        """
+        Enqueues given event, starting the consumer if needed.
+        :param event: The event.
+        :type event: pythoneda.Event
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_size)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._consume())
+        await self._queue.put(event)
+
+    async def flush(self):
+        """
+        Waits until every queued event has been delivered.
+        """
+        if self._queue is not None:
+            if not self._queue.empty() and (self._task is None or self._task.done()):
+                # The consumer is gone: restart it, or join() would never return
+                self._task = asyncio.create_task(self._consume())
+            await self._queue.join()
+
+    async def close(self):
+        """
+        Delivers the queued events, and stops the consumer.
+        """
+        await self.flush()
+        task = self._task
+        self._task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _drain(self, batch: List[Event]):
+        """
+        Moves already-queued events into given batch, up to its limit.
+        :param batch: The batch being filled.
+        :type batch: List[pythoneda.Event]
+        """
+        while len(batch) < self._max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _consume(self):
+        """
+        Consumes the queue, delivering events in batches.
+        """
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if len(batch) < self._max_batch and self._max_delay > 0:
+                await asyncio.sleep(self._max_delay)
+                self._drain(batch)
+            try:
+                await self._deliver(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
 
 
 class EventEmitter(BaseObject, Port, abc.ABC):
@@ -37,7 +139,8 @@ class EventEmitter(BaseObject, Port, abc.ABC):
         - Event: The events being emitted.
     """
 
-    _receivers = []
+    _receivers = {}
+    _batcher = None
 
     def __init__(self):
         """
@@ -45,6 +148,44 @@ class EventEmitter(BaseObject, Port, abc.ABC):
         """
         super().__init__()
 
+    def enable_batching(
+        self, maxBatch: int = 100, maxDelay: float = 0.005, maxSize: int = 0
+    ):
+        """
+        Makes emit() queue events and deliver them in batches.
+        Receivers providing accept_batch(events) get each batch at once;
+        the rest get its events one by one.
+        :param maxBatch: The maximum number of events per batch.
+        :type maxBatch: int
+        :param maxDelay: The seconds to wait for a batch to fill up.
+        :type maxDelay: float
+        :param maxSize: The queue capacity (0 means unbounded).
+        :type maxSize: int
+        """
+        if self._batcher is not None:
+            # Replacing it would orphan its consumer and its queued events
+            raise RuntimeError(
+                "Batching is already enabled; call disable_batching() first"
+            )
+        self._batcher = _EmitBatcher(self._emit_batch, maxBatch, maxDelay, maxSize)
+
+    async def flush(self):
+        """
+        Waits until every batched event has been delivered.
+        """
+        if self._batcher is not None:
+            await self._batcher.flush()
+
+    async def disable_batching(self):
+        """
+        Delivers the batched events and makes emit() deliver events right
+        away again. Call it before the event loop stops, so no event is lost.
+        """
+        batcher = self._batcher
+        if batcher is not None:
+            self._batcher = None
+            await batcher.close()
+
     @classmethod
     def receivers(cls):
         """
@@ -52,7 +193,7 @@ class EventEmitter(BaseObject, Port, abc.ABC):
         :return: Such listeners.
         :rtype: List
         """
-        return EventEmitter._receivers
+        return list(EventEmitter._receivers)
 
     @classmethod
     def register_receiver(cls, receiver):
@@ -61,8 +202,7 @@ class EventEmitter(BaseObject, Port, abc.ABC):
         :param receiver: The event receiver to register.
         :type receiver: pythoneda.EventListener
         """
-        if receiver not in EventEmitter._receivers:
-            EventEmitter._receivers.append(receiver)
+        EventEmitter._receivers.setdefault(receiver, None)
 
     @classmethod
     def unregister_receiver(cls, receiver):
@@ -71,17 +211,120 @@ class EventEmitter(BaseObject, Port, abc.ABC):
         :param receiver: The event listener to unregister.
         :type receiver: pythoneda.EventListener
         """
-        if receiver in EventEmitter._receivers:
-            EventEmitter._receivers.remove(receiver)
+        EventEmitter._receivers.pop(receiver, None)
 
     async def emit(self, event: Event):
         """
-        Emits given event.
+        Emits given event, or queues it if batching is enabled.
         :param event: The event to emit.
         :type event: pythoneda.Event
         """
-        for receiver in EventEmitter._receivers:
-            await receiver.accept(event)
+        if self._batcher is None:
+            await self.emit_now(event)
+        else:
+            await self._batcher.put(event)
+
+    async def emit_now(self, event: Event):
+        """
+        Emits given event right away, bypassing any batching.
+        All receivers get the event even if some of them fail; afterwards,
+        the first failure is raised.
+        :param event: The event to emit.
+        :type event: pythoneda.Event
+        """
+        receivers = list(EventEmitter._receivers)
+        if not receivers:
+            return
+
+        results = await asyncio.gather(
+            *(receiver.accept(event) for receiver in receivers),
+            return_exceptions=True,
+        )
+        failures = self._log_failures(receivers, results, f"{event}")
+        if failures:
+            raise self._most_severe(failures)
+
+    async def _emit_batch(self, events: List[Event]):
+        """
+        Delivers given batch to all receivers.
+        :param events: The events to deliver.
+        :type events: List[pythoneda.Event]
+        """
+        receivers = list(EventEmitter._receivers)
+        if not receivers:
+            return
+
+        results = await asyncio.gather(
+            *(self._accept_batch(receiver, events) for receiver in receivers),
+            return_exceptions=True,
+        )
+        # Nobody awaits the batch delivery, so failures are only logged;
+        # cancellation and interpreter exits still propagate.
+        failures = self._log_failures(receivers, results, f"{len(events)} events")
+        for failure in failures:
+            if not isinstance(failure, Exception):
+                raise failure
+
+    @staticmethod
+    def _log_failures(
+        receivers: List, results: List, description: str
+    ) -> List[BaseException]:
+        """
+        Logs the receivers that failed, according to given gather results.
+        :param receivers: The receivers.
+        :type receivers: List[pythoneda.EventListener]
+        :param results: Their results, as returned by asyncio.gather.
+        :type results: List
+        :param description: What the receivers were given.
+        :type description: str
+        :return: The failures, in receiver order.
+        :rtype: List[BaseException]
+        """
+        result = []
+        for receiver, outcome in zip(receivers, results):
+            # Not just Exception: CancelledError and the like are failures too
+            if isinstance(outcome, BaseException):
+                EventEmitter.logger().error(
+                    f"{receiver} failed to accept {description}: {outcome!r}"
+                )
+                result.append(outcome)
+
+        return result
+
+    @staticmethod
+    def _most_severe(failures: List[BaseException]) -> BaseException:
+        """
+        Picks the failure to raise: the first one not being a plain
+        Exception (e.g. cancellation), or else the first one.
+        :param failures: The failures.
+        :type failures: List[BaseException]
+        :return: Such failure.
+        :rtype: BaseException
+        """
+        result = failures[0]
+        for failure in failures:
+            if not isinstance(failure, Exception):
+                result = failure
+                break
+
+        return result
+
+    @staticmethod
+    async def _accept_batch(receiver, events: List[Event]):
+        """
+        Hands given batch to a receiver, event by event if it cannot take
+        them all at once.
+        :param receiver: The receiver.
+        :type receiver: pythoneda.EventListener
+        :param events: The events.
+        :type events: List[pythoneda.Event]
+        """
+        accept_batch = getattr(receiver, "accept_batch", None)
+        if accept_batch is None:
+            for event in events:
+                await receiver.accept(event)
+        else:
+            await accept_batch(events)
 
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
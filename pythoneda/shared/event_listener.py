@@ -19,41 +19,26 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from . import BaseObject, Event
+from . import BaseObject, Event, full_class_name
 import abc
-import functools
+from collections import defaultdict
 import inspect
+from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Type
 
 
 _event_listeners = {}
-_event_listeners_by_event_class = {}
-_event_listener_methods = {}
+# Event class -> listener classes, as an insertion-ordered set
+_event_listeners_by_event_class = defaultdict(dict)
+_event_listener_methods = defaultdict(dict)
 _pending_event_listeners = {}
-
-
-def _build_cls_key(cls):
-    """
-    Builds a key for given class.
-    :param cls: The class.
-    :type cls: type
-    :return: A key.
-    :rtype: str
-    """
-    return f"{cls.__module__}.{cls.__name__}"
-
-
-def _is_function(fn) -> bool:
-    """
-    Checks whether given parameter is a function.
-    :param fn: The potential function.
-    :type fn: Any
-    :return: True if it's a function, False otherwise.
-    :rtype: bool
-    """
-    function_to_check = _unwrap_function(fn)
-    result = callable(function_to_check)
-    return result
+# Like the registries above, the caches below reference classes strongly:
+# classes are expected to live as long as the process.
+_listeners_for_cache = {}
+# Event class -> {listener class: @listen method, or None}
+_listen_method_cache = {}
+# Ancestors which aren't EventListeners, and were found to have no @listen methods
+_classes_without_listeners = set()
 
 
 def _unwrap_function(fn) -> Callable:
@@ -64,10 +49,9 @@ def _unwrap_function(fn) -> Callable:
     :return: The unwrapped function.
     :rtype: Callable
     """
-    result = fn
-    while hasattr(result, "__func__"):
-        result = getattr(result, "__func__")
-    return result
+    # Only classmethod, staticmethod and bound methods carry __func__,
+    # and they don't nest
+    return getattr(fn, "__func__", fn)
 
 
 def _build_func_key(fn):
@@ -82,17 +66,6 @@ def _build_func_key(fn):
     return func
 
 
-def _classes_by_key(key):
-    """
-    Retrieves the classes annotated under given key.
-    :param key: The key.
-    :type key: str
-    :return: The list of classes.
-    :rtype: List
-    """
-    return [m[1] for m in inspect.getmembers(key, inspect.isclass)]
-
-
 def _add_to_pending(func: Callable, eventClass: Type[Any], store: Dict):
     """
     Adds given function (specifically a derived value) in a list.
@@ -106,18 +79,6 @@ def _add_to_pending(func: Callable, eventClass: Type[Any], store: Dict):
     store[_build_func_key(func)] = eventClass
 
 
-def _add_wrapper(func: Callable, eventClass: Type[Any]):
-    """
-    Annotates given wrapper.
-    :param func: The wrapper.
-    :type func: callable
-    :param eventClass: The class of the event.
-    :type eventClass: pythoneda.Event
-    """
-    unwrapped = _unwrap_function(func)
-    _add_to_pending(unwrapped, eventClass, _pending_event_listeners)
-
-
 def listen(eventClass: Type[Any]):
     """
     Decorator to annotate an event listener.
@@ -126,35 +87,27 @@ def listen(eventClass: Type[Any]):
     """
 
     def decorator(func: Callable):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        _add_wrapper(wrapper, eventClass)
-        return wrapper
+        # No wrapper: the function itself is registered, and called on dispatch
+        _add_to_pending(_unwrap_function(func), eventClass, _pending_event_listeners)
+        return func
 
     return decorator
 
 
-def _is_listen_method(fn: Callable) -> bool:
+def _listen_function(fn: Any) -> Callable:
     """
-    Checks whether a function is annotated with the @listen decorator.
-    :param fn: The function to check.
-    :type fn: Callable
-    :return: True if it's a @listen class method; False otherwise.
-    :rtype: bool
+    Retrieves the function annotated with the @listen decorator, if given
+    class attribute is such a (pending) class method.
+    :param fn: The class attribute to check.
+    :type fn: Any
+    :return: The unwrapped @listen function, or None otherwise.
+    :rtype: Callable
     """
-    from .event_listener import _pending_event_listeners
-
-    func = _unwrap_function(fn)
-    return (
-        isinstance(fn, classmethod)
-        and _is_function(func)
-        and _build_func_key(func) in _pending_event_listeners
-    )
-
-
-#    return _is_function(func) and _build_func_key(func) in _pending_event_listeners
+    result = None
+    # First, @classmethod. Then, @listen: the pending function is __func__
+    if isinstance(fn, classmethod) and fn.__func__ in _pending_event_listeners:
+        result = fn.__func__
+    return result
 
 
 def _process_pending_event_listeners(cls: Type[Any]):
@@ -163,29 +116,21 @@ def _process_pending_event_listeners(cls: Type[Any]):
     :param cls: The class holding the event listeners.
     :type cls: Type[Any]
     """
-    from .event_listener import (
-        _pending_event_listeners,
-        _event_listeners,
-        _event_listener_methods,
-    )
-
-    for name, listener in vars(cls).items():
-        if _is_listen_method(listener):
-            # First, @classmethod. Then, @listen.
-            # That's why we are passing `listener.__func__, which is our @listen function`
-            _process_pending_event_listener(
-                cls,
-                listener,
-                _pending_event_listeners,
-                _event_listeners,
-                _event_listeners_by_event_class,
-                _event_listener_methods,
-            )
-    for current_parent in cls.mro():
-        for name, listener in vars(current_parent).items():
-            if _is_listen_method(listener):
-                # First, @classmethod. Then, @listen.
-                # That's why we are passing `listener.__func__, which is our @listen function`
+    if not _pending_event_listeners:
+        return
+
+    for current_class in cls.__mro__:
+        if current_class is not cls and (
+            current_class in _event_listeners
+            or current_class in _classes_without_listeners
+        ):
+            # Already processed when it was defined: see _propagate_event_listeners_upwards
+            continue
+        found = False
+        for attribute in vars(current_class).values():
+            listener = _listen_function(attribute)
+            if listener is not None:
+                found = True
                 _process_pending_event_listener(
                     cls,
                     listener,
@@ -194,12 +139,19 @@ def _process_pending_event_listeners(cls: Type[Any]):
                     _event_listeners_by_event_class,
                     _event_listener_methods,
                 )
+                if current_class is cls:
+                    # Subclasses inherit it through the registries from now on.
+                    # Mixins' methods stay pending, for every class using them.
+                    _pending_event_listeners.pop(listener, None)
+        if not found and current_class is not cls:
+            # Its attributes are fixed, so there's no need to scan it again
+            _classes_without_listeners.add(current_class)
 
 
 def _process_pending_event_listener(
     cls: Type[Any],
     listener: Callable,
-    pending: List,
+    pending: Dict,
     listeners: Dict,
     listenersByEventClass: Dict,
     methods: Dict,
@@ -208,10 +160,10 @@ def _process_pending_event_listener(
     Processes a pending event listener.
     :param cls: The class holding the event listener.
     :type cls: Type[Any]
-    :param listener: The listener.
+    :param listener: The unwrapped @listen function.
     :type listener: Callable
     :param pending: The pending listeners.
-    :type pending: List
+    :type pending: Dict
     :param listeners: The final listeners.
     :type listeners: Dict
     :param listenersByEventClass: The mapping between event classes and listeners.
@@ -219,48 +171,41 @@ def _process_pending_event_listener(
     :param methods: The listener methods.
     :type methods: Dict
     """
-    func = _unwrap_function(listener)
-    cls_key = _build_cls_key(cls)
-    if _is_function(func) and _build_func_key(func) in pending:
-        aux_listeners = listeners.get(cls_key, None)
+    func = listener
+    event_class = pending.get(func, None)
+    if event_class is not None and callable(func):
+        aux_listeners = listeners.get(cls, None)
         if aux_listeners is None:
             aux_listeners = []
-        aux_listeners.append(pending[_build_func_key(func)])
-        listeners[cls_key] = aux_listeners
-        aux_listeners_by_event_class = listenersByEventClass.get(
-            pending[_build_func_key(func)], None
-        )
-        if aux_listeners_by_event_class is None:
-            aux_listeners_by_event_class = []
-        if cls not in aux_listeners_by_event_class:
-            aux_listeners_by_event_class.append(cls)
-        listenersByEventClass[pending[_build_func_key(func)]] = (
-            aux_listeners_by_event_class
-        )
-        aux_methods = methods.get(cls_key, None)
-        if aux_methods is None:
-            aux_methods = {}
-        aux_methods[pending[_build_func_key(func)]] = func
-        methods[cls_key] = aux_methods
+        if event_class not in aux_listeners:
+            aux_listeners.append(event_class)
+        listeners[cls] = aux_listeners
+        listenersByEventClass[event_class].setdefault(cls, None)
+        # The class' own method comes first, and wins over inherited ones
+        methods[cls].setdefault(event_class, func)
 
 
 def _propagate_event_listeners_upwards(cls):
     """
     Propagates event listeners from given class' parents.
+    Each parent collected its own listeners, and those it inherited, when it was
+    defined, so they are copied instead of scanning the parents again.
     :param cls: The class holding the listeners.
     :type cls: type
     """
-    from .event_listener import _event_listeners
-
-    cls_key = _build_cls_key(cls)
-    if cls_key not in _event_listeners.keys():
-        _event_listeners[cls_key] = []
-    for current_parent in cls.mro():
-        parent_cls_key = _build_cls_key(current_parent)
-        if parent_cls_key in _event_listeners.keys():
-            for event_listener in _event_listeners[parent_cls_key]:
-                if event_listener not in _event_listeners[cls_key]:
-                    _event_listeners[cls_key].append(event_listener)
+    # Insertion-ordered set, so merging the parents' lists stays linear
+    event_classes = dict.fromkeys(_event_listeners.get(cls, []))
+    for current_parent in cls.__mro__[1:]:
+        if current_parent in _event_listeners.keys():
+            for event_listener in _event_listeners[current_parent]:
+                event_classes.setdefault(event_listener, None)
+                _event_listeners_by_event_class[event_listener].setdefault(cls, None)
+            parent_methods = _event_listener_methods.get(current_parent, {})
+            if parent_methods:
+                methods = _event_listener_methods[cls]
+                for event_class, method in parent_methods.items():
+                    methods.setdefault(event_class, method)
+    _event_listeners[cls] = tuple(event_classes)
 
 
 class EventListener(BaseObject, abc.ABC):
@@ -286,8 +231,6 @@ class EventListener(BaseObject, abc.ABC):
         :return: Such mapping.
         :rtype: Dict
         """
-        from .event_listener import _event_listeners
-
         return _event_listeners
 
     @classmethod
@@ -297,8 +240,6 @@ class EventListener(BaseObject, abc.ABC):
         :return: Such mapping.
         :rtype: Dict
         """
-        from .event_listener import _event_listeners_by_event_class
-
         return _event_listeners_by_event_class
 
     @classmethod
@@ -308,29 +249,34 @@ class EventListener(BaseObject, abc.ABC):
         :return: Such mapping.
         :rtype: Dict
         """
-        from .event_listener import _event_listener_methods
-
         return _event_listener_methods
 
     @classmethod
     def listeners_for(cls, eventClass: Type[Event]) -> List[Type]:
         """
-        Retrieves the listeners associated to a certain Event class.
+        Retrieves the listeners associated to a certain Event class, or to any
+        of its parents.
         :param eventClass: The type of event.
         :type eventClass: Type[Event]
         :return: The matching listeners.
         :rtype: List[Type]
         """
-        aux = EventListener.listeners_by_event_class().get(eventClass, [])
-        EventListener.listeners_by_event_class()[eventClass] = aux
+        result = _listeners_for_cache.get(eventClass, None)
+        if result is None:
+            listeners_by_event_class = EventListener.listeners_by_event_class()
+            aux = {}
+            for current_class in eventClass.__mro__:
+                for clz in listeners_by_event_class.get(current_class, {}):
+                    aux.setdefault(clz, None)
+
+            result = tuple(
+                clz
+                for clz in sorted(aux, key=cls._get_priority)
+                if not inspect.isabstract(clz)
+            )
+            _listeners_for_cache[eventClass] = result
 
-        result = [
-            clz
-            for clz in sorted(aux, key=cls._get_priority)
-            if not inspect.isabstract(clz)
-        ]
-
-        return result
+        return list(result)
 
     @classmethod
     def delegate_priority(cls, primaryPort) -> int:
@@ -342,28 +288,44 @@ class EventListener(BaseObject, abc.ABC):
         :rtype: int
         """
         result = -1
-        if cls.has_default_priority_method(primaryPort):
-            result = primaryPort.default_priority()
+        default_priority = getattr(primaryPort, "default_priority", None)
+        if default_priority is not None:
+            result = default_priority()
 
-        if cls.has_priority_method(primaryPort):
-            instance = cls.get_primary_port_instance(primaryPort)
-            if instance:
-                result = instance.priority()
+        priority = getattr(primaryPort, "priority", None)
+        if inspect.ismethod(priority):
+            # A class method: no need to build the port just to ask
+            result = priority()
+        elif priority is not None:
+            result = primaryPort().priority()
 
         return result
 
     @classmethod
     def listen_method_for(cls, eventClass: Type[Any]) -> Callable:
         """
-        Retrieves the @listen() method for given event, in this class.
+        Retrieves the @listen() method for given event, or for the closest of
+        its parents, in this class.
         :param eventClass: The event class.
         :type eventClass: Type[Any]
         :return: The @listen-decorated method.
         :rtype: Callable
         """
-        cls_key = _build_cls_key(cls)
-        methods = EventListener.listener_methods().get(cls_key, {})
-        return methods.get(eventClass, None)
+        handles = _listen_method_cache.get(eventClass, None)
+        if handles is None:
+            handles = {}
+            _listen_method_cache[eventClass] = handles
+        if cls in handles:
+            result = handles[cls]
+        else:
+            result = None
+            methods = EventListener.listener_methods().get(cls, {})
+            for current_class in eventClass.__mro__:
+                result = methods.get(current_class, None)
+                if result is not None:
+                    break
+            handles[cls] = result
+        return result
 
     @classmethod
     def _get_priority(cls, eventListener: Type[Any]) -> int:
@@ -398,7 +360,7 @@ class EventListener(BaseObject, abc.ABC):
         method = cls.listen_method_for(event.__class__)
         if method is None:
             EventListener.logger().error(
-                f"Cannot find @listen({cls.full_class_name(event.__class__)}) method on {cls.full_class_name(cls)}"
+                f"Cannot find @listen({full_class_name(event.__class__)}) method on {full_class_name(cls)}"
             )
         else:
             aux = await method(cls, event)
@@ -418,14 +380,15 @@ class EventListener(BaseObject, abc.ABC):
         """
         super().__init_subclass__(**kwargs)
         _process_pending_event_listeners(cls)
-        #        for current_parent in cls.mro():
-        #            _process_pending_event_listeners(current_parent)
         _propagate_event_listeners_upwards(cls)
-        from .event_listener import (
-            _pending_event_listeners,
-        )
-
-        del _pending_event_listeners
+        # A class' registry entries are complete once it's defined
+        if cls in _event_listener_methods:
+            _event_listener_methods[cls] = MappingProxyType(
+                dict(_event_listener_methods[cls])
+            )
+        # New listeners invalidate the cached lookups
+        _listeners_for_cache.clear()
+        _listen_method_cache.clear()
 
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
@@ -21,6 +21,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from . import BaseObject, Event, EventListener, PrimaryPort
 import abc
+import asyncio
 from typing import Type
 
 
@@ -53,13 +54,42 @@ class EventListenerPort(BaseObject, PrimaryPort, abc.ABC):
     async def accept(cls, event: Event):
         """
         Notification of a supported event.
+        If any listener fails, its exception is raised once all listeners
+        finish, with the other listeners' events in its `partial_events`.
         :param event: The event.
         :type event: Event
         :return: Potentially, a list of triggered events in response.
         :rtype: List
         """
         EventListenerPort.logger().info(f"Accepting event {event}")
-        return await EventListener.accept(event)
+        listeners = EventListener.listeners_for(event.__class__)
+        # Listeners are independent of each other, so they run concurrently;
+        # gather() keeps their results in priority order.
+        responses = await asyncio.gather(
+            *(listener.accept(event) for listener in listeners),
+            return_exceptions=True,
+        )
+        result = []
+        failures = []
+        for listener, response in zip(listeners, responses):
+            if isinstance(response, BaseException):
+                EventListenerPort.logger().error(
+                    f"{listener} failed to accept {event}: {response!r}"
+                )
+                failures.append(response)
+            else:
+                result.extend(response)
+
+        if failures:
+            # Cancellation and interpreter exits come first
+            failure = next(
+                (f for f in failures if not isinstance(f, Exception)), failures[0]
+            )
+            # The events of the listeners which succeeded travel with it
+            failure.partial_events = result
+            raise failure
+
+        return result
 
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
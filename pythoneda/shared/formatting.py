@@ -58,10 +58,15 @@ class Formatting(BaseObject):
     def __getattr__(self, attr):
         """
         Delegates any method call to the wrapped instance.
+        Methods bound to it are kept in this instance, so later lookups don't
+        get here; other values are always read afresh, as they might change.
         :param attr: The attribute.
         :type attr: Object
         """
-        return getattr(self._fmt, attr)
+        result = getattr(self._fmt, attr)
+        if getattr(result, "__self__", None) is self._fmt:
+            self.__dict__[attr] = result
+        return result
 
     def __str__(self):
         """
@@ -19,6 +19,8 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from datetime import datetime
+import sys
 
 
 class LoggingFallback:
@@ -34,7 +36,12 @@ class LoggingFallback:
     - None
     """
 
-    _category = ""
+    __slots__ = (
+        "_category",
+        "_threshold_level",
+        "_truncated_category",
+        "_threshold_value",
+    )
 
     def __init__(self, thresholdLevel: str, category: str):
         """
@@ -47,6 +54,9 @@ class LoggingFallback:
         super().__init__()
         self._category = category
         self._threshold_level = thresholdLevel
+        # Both are fixed for the lifetime of the logger
+        self._truncated_category = self.truncate_category(category, 25)
+        self._threshold_value = self.level_to_int(thresholdLevel)
 
     @property
     def category(self) -> str:
@@ -89,6 +99,17 @@ class LoggingFallback:
             return 5
         return 0
 
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Checks whether messages of given level would be logged, mimicking
+        logging.Logger.isEnabledFor.
+        :param level: The numeric logging level.
+        :type level: int
+        :return: True in such case.
+        :rtype: bool
+        """
+        return level >= self._threshold_value
+
     def _log(self, level: str, message: str):
         """
         Logs a message.
@@ -97,24 +118,21 @@ class LoggingFallback:
         :param message: The error message.
         :type message: str
         """
-        from .invariants import Invariants
-        from .pythoneda_application import PythonedaApplication
-
-        category = self.truncate_category(self.category, 25)
-        invariant_app = Invariants.instance().apply(PythonedaApplication.invariant_type)
-        level_value = self.level_to_int(level)
-        threshold_value = self.level_to_int(self.threshold_level)
-        if level_value <= threshold_value:
-            from datetime import datetime
-
-            time_format = "%Y-%m-%d %H:%M:%S"
-            current_time = datetime.now().strftime(time_format)
+        if self.isEnabledFor(self.level_to_int(level)):
+            from .invariants import Invariants
+            from .pythoneda_application import PythonedaApplication
+
+            invariant_app = Invariants.instance().apply(
+                PythonedaApplication.invariant_type
+            )
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             if invariant_app is None:
-                print(f"[?!] {current_time} - {category} - {level.upper()} - {message}")
+                app = "?!"
             else:
-                print(
-                    f"[{invariant_app.value}] {current_time} - {category} - {level.upper()} - {message}"
-                )
+                app = invariant_app.value
+            sys.stdout.write(
+                f"[{app}] {current_time} - {self._truncated_category} - {level.upper()} - {message}\n"
+            )
 
     def truncate_category(self, category: str, maxLength: int):
         """
@@ -207,6 +225,8 @@ class LoggingPortFallback:
     - None
     """
 
+    __slots__ = ("_threshold_level",)
+
     def __init__(self, thresholdLevel: str):
         """
         Initializes a new LoggingPortFallback instance.
@@ -39,13 +39,10 @@ class Port(abc.ABC):
         - Ports maintain a registry of Port instances.
     """
 
-    _enabled = True
+    # Adapters declaring their own __slots__ don't get a __dict__ from here
+    __slots__ = ()
 
-    def __init__(self):
-        """
-        Creates a new instance.
-        """
-        super().__init__()
+    _enabled = True
 
     @classmethod
     def enable(cls, *args: Tuple, **kwargs: Dict):
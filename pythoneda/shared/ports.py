@@ -25,6 +25,8 @@ from .port import Port
 from .pythoneda_application import PythonedaApplication
 import importlib
 import inspect
+import sys
+from types import MappingProxyType
 from typing import Dict, List, Type
 
 
@@ -45,6 +47,9 @@ class Ports:
     """
 
     _singleton = None
+    _priorities = {}
+    _priority_methods = {}
+    _ports_by_name = {}
 
     def __init__(self, mappings: Dict[Type[Port], List[Port]]):
         """
@@ -54,7 +59,14 @@ class Ports:
         :param app: The application instance.
         :type app: pythoneda.shared.application.PythonEDA
         """
-        self._mappings = mappings
+        # Read-only from here on, with tuples so lookups share their values
+        self._mappings = MappingProxyType(
+            {port: tuple(adapters) for port, adapters in (mappings or {}).items()}
+        )
+        # Port -> its candidates, sorted by priority on first use
+        self._sorted_mappings = {}
+        # Adapter class -> its instance, created on first resolve
+        self._adapters = {}
 
     @classmethod
     def initialize(
@@ -90,24 +102,29 @@ class Ports:
 
         return result
 
-    def resolve(self, port: Type[Port]) -> List[Port]:
+    def resolve(self, port: Type[Port], cache: bool = True) -> List[Port]:
         """
         Resolves given port.
         :param port: The Port to resolve.
         :type port: Type[pythoneda.Port]
+        :param cache: Whether to reuse the adapter instances from previous calls.
+        :type cache: bool
         :return: The adapters.
         :rtype: List[pythoneda.Port]
         """
-        result = []
-        adapter_classes_or_instances = self.resolve_all(port)
+        adapters = []
+        adapter_classes_or_instances = self.filter_by_invariants(
+            self._mappings.get(port, ())
+        )
         for adapter_class_or_instance in adapter_classes_or_instances:
             if inspect.isclass(adapter_class_or_instance):
                 adapter_class = adapter_class_or_instance
-                result.append(self._instantiate_adapter(adapter_class))
+                adapters.append(self._instantiate_adapter(adapter_class, cache))
             else:
-                result.append(adapter_class_or_instance)
+                adapters.append(adapter_class_or_instance)
 
-        return result
+        # Sort the instances themselves, so each adapter is instantiated once.
+        return sorted(adapters, key=self.__class__._adapter_priority)
 
     def resolve_first(self, port: Type[Port]) -> Port:
         """
@@ -124,16 +141,23 @@ class Ports:
 
         return result
 
-    @staticmethod
-    def _instantiate_adapter(adapterClass: Port) -> Port:
+    def _instantiate_adapter(self, adapterClass: Port, cache: bool = True) -> Port:
         """
         Instantiates given adapter.
         :param adapterClass: The adapter class.
         :type adapterClass: pythoneda.Port
+        :param cache: Whether to reuse a previous instance.
+        :type cache: bool
         :return: The adapter instance.
         :rtype: pythoneda.Port
         """
-        return adapterClass.instantiate()
+        result = self._adapters.get(adapterClass, None) if cache else None
+        if result is None:
+            result = adapterClass.instantiate()
+            if cache:
+                self._adapters[adapterClass] = result
+
+        return result
 
     @classmethod
     def sort_by_priority(cls, otherClass: Port) -> int:
@@ -144,14 +168,50 @@ class Ports:
         :return: Such priority.
         :rtype: int
         """
+        # An adapter class' priority doesn't change: compute it once
+        is_class = inspect.isclass(otherClass)
+        result = Ports._priorities.get(otherClass, None) if is_class else None
+        if result is None:
+            result = -1
+            if has_class_method(otherClass, "default_priority"):
+                result = otherClass.default_priority()
+
+            if has_method(otherClass, "priority"):
+                instance = otherClass.instantiate()
+                if instance:
+                    result = instance.priority()
+
+            if is_class:
+                Ports._priorities[otherClass] = result
+
+        return result
+
+    @staticmethod
+    def _adapter_priority(adapter: Port) -> int:
+        """
+        Retrieves the priority of an already instantiated adapter.
+        :param adapter: The adapter instance.
+        :type adapter: pythoneda.Port
+        :return: Such priority.
+        :rtype: int
+        """
+        # The reflection depends on the adapter's class only: check it once
+        adapter_class = type(adapter)
+        methods = Ports._priority_methods.get(adapter_class, None)
+        if methods is None:
+            methods = (
+                has_class_method(adapter, "default_priority"),
+                has_method(adapter, "priority"),
+            )
+            Ports._priority_methods[adapter_class] = methods
+        has_default_priority, has_priority = methods
+
         result = -1
-        if has_class_method(otherClass, "default_priority"):
-            result = otherClass.default_priority()
+        if has_default_priority:
+            result = adapter.default_priority()
 
-        if has_method(otherClass, "priority"):
-            instance = otherClass.instantiate()
-            if instance:
-                result = instance.priority()
+        if has_priority:
+            result = adapter.priority()
 
         return result
 
@@ -163,9 +223,15 @@ class Ports:
         :return: The adapter.
         :rtype: List[pythoneda.Port]
         """
+        candidates = self._sorted_mappings.get(port, None)
+        if candidates is None:
+            candidates = sorted(
+                self._mappings.get(port, ()), key=self.__class__.sort_by_priority
+            )
+            self._sorted_mappings[port] = candidates
 
-        candidates = self.filter_by_invariants(self._mappings.get(port, []))
-        return sorted(candidates, key=self.__class__.sort_by_priority)
+        # Filtering keeps the order, and invariants may change between calls
+        return self.filter_by_invariants(candidates)
 
     def filter_by_invariants(self, adapters: List[Port]) -> List[Port]:
         """
@@ -196,8 +262,14 @@ class Ports:
         :return: The adapter.
         :rtype: Port
         """
-        module = importlib.import_module(moduleName)
-        port = getattr(module, portName)
+        port = Ports._ports_by_name.get((moduleName, portName), None)
+        if port is None:
+            # Already imported modules don't need the import machinery
+            module = sys.modules.get(moduleName, None)
+            if module is None:
+                module = importlib.import_module(moduleName)
+            port = getattr(module, portName)
+            Ports._ports_by_name[(moduleName, portName)] = port
         return self.resolve(port)
 
 
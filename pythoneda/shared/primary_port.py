@@ -37,11 +37,7 @@ class PrimaryPort(Port, abc.ABC):
         - Application that resolves the adapters for PrimaryPorts.
     """
 
-    def __init__(self):
-        """
-        Creates a new instance.
-        """
-        super().__init__()
+    __slots__ = ()
 
     @abc.abstractmethod
     async def entrypoint(self, app: PythonedaApplication):
@@ -54,18 +50,10 @@ class PrimaryPort(Port, abc.ABC):
             "entrypoint(app: pythoneda.shared.PythonedaApplication) must be implemented by subclasses"
         )
 
-    @classmethod
-    @property
-    def is_one_shot_compatible(cls) -> bool:
-        """
-        Retrieves whether this primary port should be instantiated when
-        "one-shot" behavior is active.
-        It should return False if the port listens to future messages
-        from outside.
-        :return: True in such case.
-        :rtype: bool
-        """
-        return False
+    # Whether this primary port should be instantiated when "one-shot"
+    # behavior is active. It should be False if the port listens to future
+    # messages from outside. Subclasses override it as a class attribute.
+    is_one_shot_compatible: bool = False
 
     @classmethod
     def priority(cls) -> int:
@@ -37,6 +37,8 @@ class Repo(Port, abc.ABC):
         - Entity: The items persisted outside.
     """
 
+    __slots__ = ()
+
     def __init__(self, entityClass):
         """
         Creates a new instance.
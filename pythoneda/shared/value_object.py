@@ -19,27 +19,34 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from . import BaseObject, Formatting, Invariant, Invariants, SensitiveValue
+from . import (
+    BaseObject,
+    Formatting,
+    full_class_name,
+    Invariant,
+    Invariants,
+    SensitiveValue,
+)
 import functools
 import importlib
 import inspect
 import json
 import uuid
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Type, Union
+from typing import Any, Callable, Dict, List, Set, Tuple, Type, Union
 
 
 _primary_key_properties = {}
-_pending_primary_key_properties = []
+_pending_primary_key_properties = set()
 
 _filter_properties = {}
-_pending_filter_properties = []
+_pending_filter_properties = set()
 
 _internal_properties = {}
-_pending_internal_properties = []
+_pending_internal_properties = set()
 
 _properties = {}
-_pending_properties = []
+_pending_properties = set()
 
 
 def _build_func_key(func):
@@ -61,30 +68,20 @@ def _build_cls_key(cls):
     :return: A key.
     :rtype: str
     """
+    return full_class_name(cls)
 
-    return f"{cls.__module__}.{cls.__name__}"
 
-
-def _classes_by_key(key):
-    """
-    Retrieves the classes annotated under given key.
-    :param key: The key.
-    :type key: str
-    :return: The list of classes.
-    :rtype: List
-    """
-    return [m[1] for m in inspect.getmembers(key, inspect.isclass)]
-
-
-def _add_to_pending(func: Callable, lst: List, name: str = ""):
+def _add_to_pending(func: Callable, *pending: Set):
     """
-    Adds given function (specifically a derived value) in a list.
+    Adds given function (specifically a derived value) in one or more sets.
     :param func: The value to annotate.
     :type func: Callable
-    :param lst: The dictionary to store the function.
-    :type lst: List
+    :param pending: The sets to store the function.
+    :type pending: Set
     """
-    lst.append(func.__code__)
+    code = func.__code__
+    for aux in pending:
+        aux.add(code)
 
 
 def _add_wrapper(func):
@@ -93,9 +90,7 @@ def _add_wrapper(func):
     :param func: The wrapper.
     :type func: callable
     """
-    from .value_object import _pending_properties
-
-    _add_to_pending(func, _pending_properties, "properties")
+    _add_to_pending(func, _pending_properties)
 
 
 def attribute(func):
@@ -141,10 +136,7 @@ def primary_key_attribute(func):
     def wrapper(self, *args, **kwargs):
         return func(self, *args, **kwargs)
 
-    from .value_object import _pending_primary_key_properties
-
-    _add_to_pending(wrapper, _pending_primary_key_properties, "primary_key_properties")
-    _add_wrapper(wrapper)
+    _add_to_pending(wrapper, _pending_primary_key_properties, _pending_properties)
 
     return wrapper
 
@@ -160,10 +152,7 @@ def filter_attribute(func):
     def wrapper(self, *args, **kwargs):
         return func(self, *args, **kwargs)
 
-    from pythoneda.shared.value_object import _pending_filter_properties
-
-    _add_to_pending(wrapper, _pending_filter_properties, "filter_properties")
-    _add_wrapper(wrapper)
+    _add_to_pending(wrapper, _pending_filter_properties, _pending_properties)
 
     return wrapper
 
@@ -179,61 +168,30 @@ def internal_attribute(func):
     def wrapper(self, *args, **kwargs):
         return func(self, *args, **kwargs)
 
-    from .value_object import _pending_internal_properties
-
-    _add_to_pending(wrapper, _pending_internal_properties, "internal_properties")
+    _add_to_pending(wrapper, _pending_internal_properties)
     return wrapper
 
 
-def _process_pending_properties(cls: type, delete: bool = False):
+def _process_pending_properties(cls: type):
     """
     Processes all pending properties of given class.
     :param cls: The class holding the properties.
     :type cls: type
-    :param delete: Whether to clean up pending properties at the end or not.
-    :type delete: bool
     """
-    from .value_object import (
-        _properties,
-        _pending_properties,
-        _primary_key_properties,
-        _pending_primary_key_properties,
-        _filter_properties,
-        _pending_filter_properties,
-        _internal_properties,
-        _pending_internal_properties,
-    )
-
-    source = {
-        "_properties": _pending_properties,
-        "_primary_key_properties": _pending_primary_key_properties,
-        "_filter_properties": _pending_filter_properties,
-        "_internal_properties": _pending_internal_properties,
-    }
-    dest = {
-        "_properties": _properties,
-        "_primary_key_properties": _primary_key_properties,
-        "_filter_properties": _filter_properties,
-        "_internal_properties": _internal_properties,
-    }
+    registries = [
+        (_pending_primary_key_properties, _primary_key_properties),
+        (_pending_filter_properties, _filter_properties),
+        (_pending_properties, _properties),
+        (_pending_internal_properties, _internal_properties),
+    ]
     for name, prop in cls.__dict__.items():
         if isinstance(prop, property):
-            for key in [
-                "_primary_key_properties",
-                "_filter_properties",
-                "_properties",
-                "_internal_properties",
-            ]:
-                _process_pending_property(cls, prop, source[key], dest[key], key)
-    if delete:
-        del _pending_properties
-        del _pending_filter_properties
-        del _pending_primary_key_properties
-        del _pending_internal_properties
+            for pending, properties in registries:
+                _process_pending_property(cls, prop, pending, properties)
 
 
 def _process_pending_property(
-    cls: type, prop: property, pending: List, properties: Dict, name: str = ""
+    cls: type, prop: property, pending: Set, properties: Dict
 ):
     """
     Processes a pending property.
@@ -242,18 +200,13 @@ def _process_pending_property(
     :param prop: The property.
     :type prop: property
     :param pending: The pending properties.
-    :type pending: List
+    :type pending: Set
     :param properties: The final properties.
     :type properties: Dict
     """
-    cls_key = _build_cls_key(cls)
     if prop.fget.__code__ in pending:
-        aux = properties.get(cls_key, None)
-        if not aux:
-            aux = []
-        if prop not in aux:
-            aux.append(prop)
-        properties[cls_key] = aux
+        # dicts keep insertion order, so they work as ordered sets
+        properties.setdefault(_build_cls_key(cls), {}).setdefault(prop, None)
 
 
 def _propagate_properties(cls):
@@ -262,29 +215,19 @@ def _propagate_properties(cls):
     :param cls: The class holding the properties.
     :type cls: type
     """
-    from .value_object import (
+    cls_key = _build_cls_key(cls)
+    parent_cls_keys = [_build_cls_key(parent) for parent in cls.mro()]
+    for props in [
         _properties,
         _primary_key_properties,
         _filter_properties,
         _internal_properties,
-    )
-
-    cls_key = _build_cls_key(cls)
-    for current_parent in cls.mro():
-        parent_cls_key = _build_cls_key(current_parent)
-        for props in [_properties, _primary_key_properties, _filter_properties]:
-            if parent_cls_key in props.keys():
-                if cls_key not in props.keys():
-                    props[cls_key] = []
-                for prop in props[parent_cls_key]:
-                    if prop not in props[cls_key]:
-                        props[cls_key].append(prop)
-        if parent_cls_key in _internal_properties.keys():
-            if cls_key not in _internal_properties.keys():
-                _internal_properties[cls_key] = []
-            for prop in _internal_properties[parent_cls_key]:
-                if prop not in _internal_properties[cls_key]:
-                    _internal_properties[cls_key].append(prop)
+    ]:
+        merged = {}
+        for parent_cls_key in parent_cls_keys:
+            merged.update(dict.fromkeys(props.get(parent_cls_key, ())))
+        if merged:
+            props[cls_key] = merged
 
 
 class ValueObject(BaseObject):
@@ -301,6 +244,18 @@ class ValueObject(BaseObject):
         - None
     """
 
+    _class_key = None
+    _tracked_attribute_names = frozenset()
+    _attribute_properties = ()
+    _internal_attribute_properties = ()
+    _all_attribute_properties = ()
+    _attribute_getters = ()
+    _internal_attribute_getters = ()
+    _primary_key_attribute_getters = ()
+    _primary_key_attribute_properties = ()
+    _primary_key_names = ()
+    _filter_attribute_properties = ()
+
     @classmethod
     def empty(cls):
         """
@@ -311,49 +266,31 @@ class ValueObject(BaseObject):
         return cls()
 
     @classmethod
-    def primary_key(cls) -> List:
+    def primary_key(cls) -> Tuple:
         """
-        Retrieves the list of attributes of the primary key (marked with @primary_key_attribute).
+        Retrieves the attributes of the primary key (marked with @primary_key_attribute).
         :return: The primary key attributes.
-        :rtype: List
+        :rtype: Tuple[str]
         """
-        result = []
-        key = _build_cls_key(cls)
-        from .value_object import _primary_key_properties
-
-        if key in _primary_key_properties.keys():
-            result = list(map(lambda p: p.fget.__name__, _primary_key_properties[key]))
-        return result
+        return cls._primary_key_names
 
     @classmethod
-    def filter_attributes(cls) -> List:
+    def filter_attributes(cls) -> Tuple:
         """
-        Retrieves the list of attributes used to filter (marked with @filter_attribute).
+        Retrieves the attributes used to filter (marked with @filter_attribute).
         :return: The filter attributes.
-        :rtype: List
+        :rtype: Tuple[property]
         """
-        result = []
-        key = _build_cls_key(cls)
-        if key in _filter_properties:
-            result = _filter_properties[key]
-        return result
+        return cls._filter_attribute_properties
 
     @classmethod
-    def attributes(cls) -> List:
+    def attributes(cls) -> Tuple:
         """
         Retrieves all the attributes (marked with @attribute).
         :return: The class attributes.
-        :rtype: List
+        :rtype: Tuple[property]
         """
-        from .value_object import _properties, _internal_properties
-
-        result = []
-        key = _build_cls_key(cls)
-        if key in _properties:
-            result = _properties[key]
-        if key in _internal_properties:
-            result = result + _internal_properties[key]
-        return result
+        return cls._all_attribute_properties
 
     def __init__(self):
         """
@@ -371,10 +308,7 @@ class ValueObject(BaseObject):
         :return: The id.
         :rtype: str
         """
-        if hasattr(self, "_id"):
-            return self._id
-        else:
-            return None
+        return self.__dict__.get("_id", None)
 
     @property
     @internal_attribute
@@ -384,10 +318,7 @@ class ValueObject(BaseObject):
         :return: The created timestamp.
         :rtype: str
         """
-        if hasattr(self, "_created"):
-            return self._created
-        else:
-            return None
+        return self.__dict__.get("_created", None)
 
     @property
     @internal_attribute
@@ -397,10 +328,7 @@ class ValueObject(BaseObject):
         :return: The updated timestamp.
         :rtype: str
         """
-        if hasattr(self, "_updated"):
-            return self._updated
-        else:
-            return None
+        return self.__dict__.get("_updated", None)
 
     @property
     @internal_attribute
@@ -420,10 +348,56 @@ class ValueObject(BaseObject):
         :type kwargs: Dict
         """
         super().__init_subclass__(**kwargs)
-        for current_parent in cls.mro():
-            _process_pending_properties(current_parent, False)
-        _process_pending_properties(cls, True)
+        for current_parent in cls.__mro__:
+            # ValueObject ancestors were processed when they were defined;
+            # other ancestors (mixins) don't get __init_subclass__ calls.
+            if current_parent is cls or not issubclass(current_parent, ValueObject):
+                _process_pending_properties(current_parent)
         _propagate_properties(cls)
+        cls._cache_attributes()
+
+    @classmethod
+    def _cache_attributes(cls):
+        """
+        Stores the attribute information collected by the decorators in this very
+        class, so it doesn't need to be looked up on every access.
+        """
+        cls._class_key = _build_cls_key(cls)
+        key = cls._class_key
+        cls._tracked_attribute_names = frozenset(
+            cls._property_name(prop) for prop in _properties.get(key, [])
+        )
+        cls._attribute_properties = tuple(_properties.get(key, []))
+        cls._internal_attribute_properties = tuple(_internal_properties.get(key, []))
+        cls._primary_key_attribute_properties = tuple(
+            _primary_key_properties.get(key, [])
+        )
+        cls._primary_key_names = tuple(
+            cls._property_name(prop) for prop in cls._primary_key_attribute_properties
+        )
+        cls._filter_attribute_properties = tuple(_filter_properties.get(key, []))
+        cls._all_attribute_properties = (
+            cls._attribute_properties + cls._internal_attribute_properties
+        )
+        # (name, getter) pairs, so rendering doesn't inspect the properties again.
+        cls._attribute_getters = cls._getters_of(cls._attribute_properties)
+        cls._internal_attribute_getters = cls._getters_of(
+            cls._internal_attribute_properties
+        )
+        cls._primary_key_attribute_getters = cls._getters_of(
+            cls._primary_key_attribute_properties
+        )
+
+    @staticmethod
+    def _getters_of(properties: Tuple) -> Tuple:
+        """
+        Retrieves the name and getter of given properties.
+        :param properties: The properties.
+        :type properties: Tuple[property]
+        :return: The name and getter of each property.
+        :rtype: Tuple[Tuple[str, Callable]]
+        """
+        return tuple((prop.fget.__name__, prop.fget) for prop in properties)
 
     @staticmethod
     def _is_json_compatible(obj: Any) -> bool:
@@ -450,7 +424,7 @@ class ValueObject(BaseObject):
         if hasattr(prop, "fget"):
             value = self._value_to_json(prop.fget(self), includeNulls)
             if value:
-                result = f'"{prop.fget.__name__}": {self._value_to_json(value, includeNulls)}'
+                result = f'"{prop.fget.__name__}": {value}'
         return result
 
     def _property_to_tuple(self, prop: property, includeNulls: bool = False) -> tuple:
@@ -586,12 +560,28 @@ class ValueObject(BaseObject):
         :return: A list with the json representation of each attribute.
         :rtype: List[str]
         """
-        return list(
-            filter(
-                lambda x: x is not None,
-                map(lambda x: self._property_to_json(x, includeNulls), properties),
-            )
-        )
+        return [
+            x
+            for x in (self._property_to_json(p, includeNulls) for p in properties)
+            if x is not None
+        ]
+
+    def _getters_to_json(self, getters: Tuple, includeNulls: bool = False) -> List[str]:
+        """
+        Builds a json-compatible representation of the attributes of given getters.
+        :param getters: The name and getter of each attribute.
+        :type getters: Tuple[Tuple[str, Callable]]
+        :param includeNulls: Whether to include nulls or not.
+        :type includeNulls: bool
+        :return: A list with the json representation of each attribute.
+        :rtype: List[str]
+        """
+        result = []
+        for name, getter in getters:
+            value = self._value_to_json(getter(self), includeNulls)
+            if value:
+                result.append(f'"{name}": {value}')
+        return result
 
     def _get_attribute_to_json(self, varName) -> str:
         """
@@ -611,7 +601,7 @@ class ValueObject(BaseObject):
         """
         result = {}
         internal_properties = {}
-        key = _build_cls_key(self.__class__)
+        key = self.__class__._class_key
         if key in _internal_properties.keys():
             for prop in _internal_properties[key]:
                 name, value = self._property_to_tuple(prop)
@@ -701,7 +691,7 @@ class ValueObject(BaseObject):
         :rtype: pythoneda.ValueObject
         """
         result = cls.empty()
-        key = _build_cls_key(cls)
+        key = cls._class_key
         for name, value in dictFromJson.items():
             for prop in _properties[key]:
                 prop_name = cls._property_name(prop)
@@ -729,20 +719,16 @@ class ValueObject(BaseObject):
         :return: The text representing this instance.
         :rtype: str
         """
-        aux = []
-        key = _build_cls_key(self.__class__)
-        if key in _properties.keys():
-            aux = self._properties_to_json(_properties[key], includeNulls=True)
-        if key in _internal_properties.keys():
-            internal = self._properties_to_json(
-                _internal_properties[key], includeNulls=False
+        cls = self.__class__
+        aux = self._getters_to_json(cls._attribute_getters, includeNulls=True)
+        if cls._internal_attribute_getters:
+            internal = self._getters_to_json(
+                cls._internal_attribute_getters, includeNulls=False
             )
-            internal.append(
-                f'"class": "{self.__class__.__module__}.{self.__class__.__name__}"'
-            )
-            aux.append('"_internal": { ' + ", ".join(internal) + " }")
+            internal.append(f'"class": "{cls.__module__}.{cls.__name__}"')
+            aux.append(f'"_internal": {{ {", ".join(internal)} }}')
 
-        if len(aux) > 0:
+        if aux:
             result = "{ " + ", ".join(aux) + " }"
         else:
             result = super().__str__()
@@ -755,22 +741,13 @@ class ValueObject(BaseObject):
         :return: The brief text representing this instance.
         :rtype: str
         """
-        aux = []
-        key = _build_cls_key(self.__class__)
-        if key in _primary_key_properties.keys():
-            aux = self._properties_to_json(
-                _primary_key_properties[key], includeNulls=False
-            )
-        aux.append(
-            f'"_internal": {{ "id": "{self.id}", "class": "{self.__class__.__name__}" }}'
+        cls = self.__class__
+        aux = self._getters_to_json(
+            cls._primary_key_attribute_getters, includeNulls=False
         )
+        aux.append(f'"_internal": {{ "id": "{self.id}", "class": "{cls.__name__}" }}')
 
-        if len(aux) > 0:
-            result = "{ " + ", ".join(aux) + " }"
-        else:
-            result = super().__repr__()
-
-        return result
+        return f'{{ {", ".join(aux)} }}'
 
     def __setattr__(self, varName, varValue):
         """
@@ -780,11 +757,9 @@ class ValueObject(BaseObject):
         :param varValue: The value of the attribute.
         :type varValue: int, bool, str, type
         """
-        key = _build_cls_key(self.__class__)
-        if key in _properties.keys():
-            if varName in [x for x in _properties[key]]:
-                self._updated = datetime.now()
         super().__setattr__(varName, varValue)
+        if varName in self.__class__._tracked_attribute_names:
+            self._updated = datetime.now()
 
     def __eq__(self, other) -> bool:
         """
@@ -800,7 +775,7 @@ class ValueObject(BaseObject):
                 result = self.__eq__(other._formatted)
             elif isinstance(other, self.__class__):
                 result = True
-                for key in self.__class__.primary_key():
+                for key in self.__class__._primary_key_names:
                     if getattr(self, key, None) != getattr(other, key, None):
                         result = False
                         break
@@ -813,16 +788,19 @@ class ValueObject(BaseObject):
         :return: Such value.
         :rtype: int
         """
-        attrs = []
-        for key in self.__class__.primary_key():
-            attrs.append(getattr(self, key, None))
-        if len(attrs) == 0:
-            result = hash((self.id, self.__class__))
+        primary_key = self.__class__._primary_key_names
+        if primary_key:
+            result = hash(tuple(getattr(self, key, None) for key in primary_key))
         else:
-            result = hash(tuple(attrs))
+            result = hash((self.id, self.__class__))
         return result
 
 
+# Subclasses are processed in __init_subclass__.
+_process_pending_properties(ValueObject)
+ValueObject._cache_attributes()
+
+
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
 # Local Variables:
 # mode: python
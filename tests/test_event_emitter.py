@@ -0,0 +1,191 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_event_emitter.py
+
+This script defines the tests for EventEmitter's batching.
+
+Copyright (C) 2023-today rydnr's pythoneda-shared-pythonlang/domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.shared import Event, EventEmitter
+import unittest
+
+
+class _Emitter(EventEmitter):
+    """
+    Concrete EventEmitter for the tests.
+    """
+
+
+class _Receiver:
+    """
+    Receiver accepting events one by one.
+    """
+
+    def __init__(self):
+        """
+        Creates a new _Receiver instance.
+        """
+        self.events = []
+
+    async def accept(self, event: Event):
+        """
+        Records given event.
+        :param event: The event.
+        :type event: pythoneda.Event
+        """
+        self.events.append(event)
+
+
+class _BatchReceiver(_Receiver):
+    """
+    Receiver accepting whole batches.
+    """
+
+    def __init__(self):
+        """
+        Creates a new _BatchReceiver instance.
+        """
+        super().__init__()
+        self.batches = []
+
+    async def accept_batch(self, events):
+        """
+        Records given batch.
+        :param events: The events.
+        :type events: List[pythoneda.Event]
+        """
+        self.batches.append(list(events))
+
+
+class EventEmitterBatchingTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Checks the batched delivery of EventEmitter.
+
+    Class name: EventEmitterBatchingTests
+
+    Responsibilities:
+        - Validate flushing, per-event fallback and shutdown.
+
+    Collaborators:
+        - EventEmitter: The tested class.
+    """
+
+    def setUp(self):
+        """
+        Isolates the receivers registered in each test.
+        """
+        self._previous_receivers = dict(EventEmitter._receivers)
+        EventEmitter._receivers.clear()
+
+    def tearDown(self):
+        """
+        Restores the previously registered receivers.
+        """
+        EventEmitter._receivers.clear()
+        EventEmitter._receivers.update(self._previous_receivers)
+
+    async def test_flush_delivers_in_emit_order(self):
+        """
+        Checks flush() waits for every event, delivered in emission order
+        and in batches no larger than the limit.
+        """
+        receiver = _BatchReceiver()
+        EventEmitter.register_receiver(receiver)
+        emitter = _Emitter()
+        emitter.enable_batching(maxBatch=3, maxDelay=0)
+        events = [Event() for _ in range(7)]
+        for event in events:
+            await emitter.emit(event)
+
+        await emitter.flush()
+
+        self.assertEqual([e for batch in receiver.batches for e in batch], events)
+        self.assertTrue(all(len(batch) <= 3 for batch in receiver.batches))
+        self.assertEqual(receiver.events, [])
+        await emitter.disable_batching()
+
+    async def test_receivers_without_accept_batch_get_each_event(self):
+        """
+        Checks receivers lacking accept_batch() get the events one by one.
+        """
+        receiver = _Receiver()
+        EventEmitter.register_receiver(receiver)
+        emitter = _Emitter()
+        emitter.enable_batching(maxBatch=10, maxDelay=0)
+        events = [Event() for _ in range(4)]
+        for event in events:
+            await emitter.emit(event)
+
+        await emitter.flush()
+
+        self.assertEqual(receiver.events, events)
+        await emitter.disable_batching()
+
+    async def test_disable_batching_drains_and_stops_the_consumer(self):
+        """
+        Checks disable_batching() delivers pending events, cancels the
+        consumer task, and makes later emits immediate.
+        """
+        receiver = _Receiver()
+        EventEmitter.register_receiver(receiver)
+        emitter = _Emitter()
+        emitter.enable_batching(maxBatch=10, maxDelay=0.05)
+        pending = [Event() for _ in range(3)]
+        for event in pending:
+            await emitter.emit(event)
+        batcher = emitter._batcher
+        task = batcher._task
+
+        await emitter.disable_batching()
+
+        self.assertEqual(receiver.events, pending)
+        self.assertTrue(task.done())
+        self.assertIsNone(emitter._batcher)
+
+        immediate = Event()
+        await emitter.emit(immediate)
+        self.assertEqual(receiver.events, pending + [immediate])
+
+    async def test_enable_batching_twice_is_rejected(self):
+        """
+        Checks enabling batching again doesn't orphan the active batcher.
+        """
+        receiver = _Receiver()
+        EventEmitter.register_receiver(receiver)
+        emitter = _Emitter()
+        emitter.enable_batching(maxBatch=10, maxDelay=0.05)
+        event = Event()
+        await emitter.emit(event)
+        batcher = emitter._batcher
+
+        with self.assertRaises(RuntimeError):
+            emitter.enable_batching()
+
+        self.assertIs(emitter._batcher, batcher)
+        await emitter.disable_batching()
+        self.assertEqual(receiver.events, [event])
+
+
+if __name__ == "__main__":
+    unittest.main()
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
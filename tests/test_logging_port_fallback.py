@@ -0,0 +1,98 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_logging_port_fallback.py
+
+This script defines the tests for LoggingFallback.
+
+Copyright (C) 2023-today rydnr's pythoneda-shared-pythonlang/domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import contextlib
+import io
+import logging
+from pythoneda.shared.logging_port_fallback import LoggingFallback
+import unittest
+
+
+class LoggingFallbackTests(unittest.TestCase):
+    """
+    Checks LoggingFallback filters messages as the stdlib loggers do.
+
+    Class name: LoggingFallbackTests
+
+    Responsibilities:
+        - Validate the threshold checks of LoggingFallback.
+
+    Collaborators:
+        - LoggingFallback: The tested class.
+    """
+
+    _thresholds = ["trace", "debug", "info", "warning", "error"]
+
+    def test_debug_is_filtered_under_info(self):
+        """
+        Checks DEBUG messages are dropped when the threshold is "info".
+        """
+        logger = LoggingFallback("info", "tests.Info")
+        self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+        self.assertTrue(logger.isEnabledFor(logging.INFO))
+
+    def test_error_is_never_filtered(self):
+        """
+        Checks ERROR messages pass every threshold up to "error".
+        """
+        for threshold in self._thresholds:
+            with self.subTest(threshold=threshold):
+                logger = LoggingFallback(threshold, "tests.Error")
+                self.assertTrue(logger.isEnabledFor(logging.ERROR))
+                self.assertTrue(logger.isEnabledFor(logging.CRITICAL))
+
+    def test_levels_below_threshold_are_filtered(self):
+        """
+        Checks only levels at or above the threshold are enabled.
+        """
+        for threshold in self._thresholds:
+            logger = LoggingFallback(threshold, "tests.Levels")
+            threshold_value = logger.level_to_int(threshold)
+            for level in self._thresholds:
+                with self.subTest(threshold=threshold, level=level):
+                    self.assertEqual(
+                        logger.isEnabledFor(logger.level_to_int(level)),
+                        logger.level_to_int(level) >= threshold_value,
+                    )
+
+    def test_log_writes_only_enabled_levels(self):
+        """
+        Checks the output matches isEnabledFor.
+        """
+        logger = LoggingFallback("info", "tests.Output")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            logger.debug("hidden")
+            logger.error("shown")
+        self.assertNotIn("hidden", output.getvalue())
+        self.assertIn("ERROR - shown", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End: